@@ -2,18 +2,464 @@
 """
 Ruliad-Seed ChatLoop API Server
 Functional backend with API key integration for end-to-end demonstration
+
+Run with `python3 api-server.py`, which serves through an embedded gunicorn
+gthread worker with HTTP keep-alive, or with gunicorn directly:
+
+    gunicorn -k gthread -w 1 --threads 16 --keep-alive 30 'api-server:create_app()'
+
+Sessions are kept in process memory, so scale with threads rather than workers,
+or set CHATLOOP_SESSION_DB to a file path to keep sessions and improvement jobs
+in SQLite and raise CHATLOOP_WORKERS. The counters reported by /health and
+/api/status, and the upstream reply cache, then stay per worker. Set
+CHATLOOP_DEV_SERVER=1 to use Werkzeug's threaded server instead.
 """
 
 import os
+import platform
+import re
 import json
-import asyncio
-import aiohttp
-import secrets
+import atexit
+import concurrent.futures
+import contextlib
+import functools
+import gzip
+import hashlib
+import logging
+import logging.handlers
+import math
+import random
+import sqlite3
+from collections import OrderedDict, deque
 from datetime import datetime
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, Response, request, render_template_string, stream_with_context
 from flask_cors import CORS
+import queue
 import threading
 import time
+import zlib
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib encoder is used otherwise
+    orjson = None
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+# Imported only when an OpenRouter key is configured, so deployments that
+# never call OpenRouter (status and benchmark only) skip their import cost
+asyncio = None
+aiohttp = None
+
+def load_upstream_modules():
+    """Import asyncio and aiohttp for the upstream client on first use"""
+    global asyncio, aiohttp
+    if aiohttp is None:
+        import asyncio
+        import aiohttp
+
+logger = logging.getLogger('chatloop')
+
+# Keyword routes for independent responses, checked in priority order
+RESPONSE_ROUTES = [
+    # Self-generation and improvement requests
+    ('get_self_generation_response', ('generate', 'create', 'build', 'improve', 'better', 'system')),
+    # Code and development requests
+    ('get_code_response', ('code', 'python', 'javascript', 'react', 'api', 'function')),
+    # Technical questions
+    ('get_help_response', ('how', 'what', 'why', 'explain', 'help', 'debug')),
+    # Suggestions and recommendations
+    ('get_suggestion_response', ('suggest', 'recommend', 'idea', 'feature')),
+    # System status and capabilities
+    ('get_system_response', ('status', 'version', 'work', 'do', 'can')),
+]
+
+# Languages recognized in generation requests, in priority order
+LANGUAGES = ['python', 'javascript', 'react', 'go', 'rust', 'java', 'c++', 'typescript']
+
+OPENROUTER_URL = 'https://openrouter.ai/api/v1/chat/completions'
+OPENROUTER_WARMUP_URL = 'https://openrouter.ai/api/v1/models'
+
+# In-flight OpenRouter requests per worker; rate-limited (429) requests are
+# retried with jittered exponential backoff, honoring Retry-After
+OPENROUTER_MAX_CONCURRENCY = int(os.environ.get('OPENROUTER_MAX_CONCURRENCY', 10))
+OPENROUTER_RETRIES = 4
+OPENROUTER_BACKOFF_MAX = 30
+
+# Streamed replies have no overall deadline; they fail if OpenRouter goes
+# quiet for this many seconds between chunks
+OPENROUTER_STREAM_IDLE = 60
+OPENROUTER_SYSTEM_MESSAGE = {
+    'role': 'system',
+    'content': 'You are Grok, a helpful AI assistant built by xAI, integrated with the Ruliad-Seed ChatLoop interface. You have access to real-time information and can help with code generation, system improvement, and technical assistance. You are maximally truthful and helpful.'
+}
+
+# Upstream chat requests arriving within this window are dispatched together
+CHAT_BATCH_WINDOW = 0.005
+CHAT_BATCH_MAX = 8
+
+# Chat tools answered locally; any other tool goes to the chat model
+LOCAL_TOOLS = ('generate', 'improve', 'benchmark')
+
+# Earlier exchanges from the caller's session sent upstream with each prompt
+CHAT_CONTEXT_TURNS = 6
+
+# Messages kept per chat session; older ones are evicted first
+SESSION_HISTORY_LIMIT = int(os.environ.get('CHATLOOP_HISTORY_MAX', 100))
+
+# Sessions kept in memory; least recently used and idle ones are evicted
+SESSION_LIMIT = 10_000
+SESSION_TTL = 3600
+SESSION_ID_PATTERN = re.compile(r'[A-Za-z0-9_-]{1,64}')
+
+# Distinct prompt and reply strings shared across in-memory session histories
+SHARED_TEXT_LIMIT = 4096
+
+# Set to a file path to keep sessions in SQLite, shared by every worker process
+SESSION_DB = os.environ.get('CHATLOOP_SESSION_DB', '')
+SESSION_DB_POOL = 8
+
+# Local chat responses are memoized; long messages are answered uncached
+RESPONSE_CACHE_SIZE = 2048
+RESPONSE_CACHE_MAX_MESSAGE = 2048
+
+# Upstream completions are reused for prompts that differ only in case or spacing
+UPSTREAM_CACHE_SIZE = 10_000
+UPSTREAM_CACHE_TTL = 3600
+
+# Finished improvement jobs kept for polling
+IMPROVEMENT_JOB_LIMIT = 1000
+
+def retry_delay(retry_after, attempt):
+    """Seconds to wait before retrying a rate-limited request"""
+    try:
+        delay = float(retry_after)
+    except (TypeError, ValueError):
+        delay = math.nan
+    if math.isfinite(delay):
+        return min(max(0.0, delay), OPENROUTER_BACKOFF_MAX)
+    # No usable Retry-After: full jitter over an exponentially growing window
+    return random.uniform(1, min(2 ** (attempt + 1), OPENROUTER_BACKOFF_MAX))
+
+def json_bytes(payload):
+    """Serialize payload to compact JSON bytes, preferring orjson"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, separators=(',', ':'), default=json_default).encode()
+
+def json_default(value):
+    """Encode datetimes as ISO strings, matching orjson"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+def json_response(payload, status=200):
+    """Build a JSON response from json_bytes; used instead of jsonify"""
+    return Response(json_bytes(payload), status=status, mimetype='application/json')
+
+def read_json():
+    """Parse the request body as JSON, or None if it is not JSON (like get_json(silent=True))"""
+    if not request.is_json:
+        return None
+    try:
+        return json_loads(request.get_data(cache=False))
+    except ValueError:
+        return None
+
+def read_chat_request():
+    """Validate a chat request as (message, session_id, tool_mode, context_session), or an error response"""
+    data = read_json()
+    if not isinstance(data, dict) or not isinstance(data.get('message'), str):
+        return json_response({'error': 'Message required'}, 400)
+
+    session_id = data.get('session_id', 'default')
+    if not isinstance(session_id, str) or not SESSION_ID_PATTERN.fullmatch(session_id):
+        return json_response({'error': 'Invalid session_id'}, 400)
+    context = data.get('context', {})
+    if not isinstance(context, dict):
+        return json_response({'error': 'Invalid context'}, 400)
+
+    # Anonymous callers share the default session, so only explicit sessions get context
+    context_session = session_id if 'session_id' in data else None
+    return data['message'], session_id, context.get('tool', 'chat'), context_session
+
+@functools.lru_cache(maxsize=256)
+def feature_tag(feature):
+    """Render a feature name as an interface tag, e.g. 'code_generation' -> 'Code Generation'"""
+    return f'<span class="feature-tag">{feature.replace("_", " ").title()}</span>'
+
+class StreamInterrupted(Exception):
+    """An upstream reply stream failed after part of the reply was sent"""
+
+class CachedBody:
+    """A constant response body kept alongside its gzip encoding and ETag"""
+
+    def __init__(self, body, mimetype='application/json', max_age=300):
+        self.body = body
+        self.gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+        self.etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        self.mimetype = mimetype
+        self.max_age = max_age
+
+    def response(self):
+        """Serve the body for the current request, gzipped when accepted"""
+        # Weak ETag: the identity and gzip encodings are the same resource
+        if request.if_none_match.contains_weak(self.etag):
+            response = Response(status=304)
+        elif request.accept_encodings['gzip']:
+            response = Response(self.gzipped, mimetype=self.mimetype)
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = Response(self.body, mimetype=self.mimetype)
+        response.set_etag(self.etag, weak=True)
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.cache_control.public = True
+        response.cache_control.max_age = self.max_age
+        return response
+
+class SessionStore:
+    """Chat session histories bounded by count and idle time (LRU eviction)"""
+
+    def __init__(self, limit=SESSION_LIMIT, ttl=SESSION_TTL):
+        self.limit = limit
+        self.ttl = ttl
+        self.sessions = OrderedDict()  # session_id -> (last_access, history)
+        self.texts = OrderedDict()  # text -> shared instance, least recently used first
+        self.lock = threading.Lock()
+
+    def get(self, session_id):
+        """Get a session's history, or None if unknown or expired"""
+        now = time.monotonic()
+        with self.lock:
+            self.evict(now)
+            entry = self.sessions.get(session_id)
+            if entry is None:
+                return None
+            self.sessions[session_id] = (now, entry[1])
+            self.sessions.move_to_end(session_id)
+            return entry[1]
+
+    def get_or_create(self, session_id):
+        """Get a session's history, starting an empty one if needed"""
+        now = time.monotonic()
+        with self.lock:
+            self.evict(now)
+            entry = self.sessions.get(session_id)
+            if entry is not None:
+                self.sessions[session_id] = (now, entry[1])
+                self.sessions.move_to_end(session_id)
+                return entry[1]
+            history = deque(maxlen=SESSION_HISTORY_LIMIT)
+            self.sessions[session_id] = (now, history)
+            if len(self.sessions) > self.limit:
+                self.sessions.popitem(last=False)
+            return history
+
+    def evict(self, now):
+        """Drop sessions idle for longer than the TTL (caller holds the lock)"""
+        while self.sessions:
+            last_access, _ = next(iter(self.sessions.values()))
+            if now - last_access <= self.ttl:
+                break
+            self.sessions.popitem(last=False)
+
+    def append(self, session_id, message):
+        """Add a message to a session's history, starting the session if needed"""
+        # Repeated prompts and replies share one string across all sessions
+        with self.lock:
+            for field in ('input', 'output'):
+                if type(message.get(field)) is str:
+                    message[field] = self.share(message[field])
+        self.get_or_create(session_id).append(message)
+
+    def share(self, text):
+        """Get the shared instance of text, evicting the least recently used (caller holds the lock)"""
+        shared = self.texts.get(text)
+        if shared is not None:
+            self.texts.move_to_end(text)
+            return shared
+        self.texts[text] = text
+        if len(self.texts) > SHARED_TEXT_LIMIT:
+            self.texts.popitem(last=False)
+        return text
+
+    def ids(self):
+        """List the live session IDs, least recently used first"""
+        now = time.monotonic()
+        with self.lock:
+            self.evict(now)
+            return list(self.sessions)
+
+    def __len__(self):
+        return len(self.sessions)
+
+class SQLiteSessionStore:
+    """SessionStore backed by a SQLite database in WAL mode, shared across processes"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sessions (
+            id TEXT PRIMARY KEY,
+            last_access REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS sessions_last_access ON sessions (last_access);
+        CREATE TABLE IF NOT EXISTS messages (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT NOT NULL,
+            body BLOB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS messages_session ON messages (session_id, seq);
+    """
+
+    def __init__(self, path, limit=SESSION_LIMIT, ttl=SESSION_TTL, pool_size=SESSION_DB_POOL):
+        self.path = path
+        self.limit = limit
+        self.ttl = ttl
+        # Connections are opened lazily so none are inherited across a fork
+        self.pool = queue.LifoQueue(maxsize=pool_size)
+        db = self.connect()
+        try:
+            db.execute('PRAGMA journal_mode=WAL')
+            db.executescript(self.SCHEMA)
+        finally:
+            db.close()
+
+    def connect(self):
+        db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=10)
+        db.execute('PRAGMA synchronous=NORMAL')
+        db.execute('PRAGMA mmap_size=268435456')
+        return db
+
+    @contextlib.contextmanager
+    def connection(self):
+        """Borrow a pooled connection, opening one if the pool is empty"""
+        try:
+            db = self.pool.get_nowait()
+        except queue.Empty:
+            db = self.connect()
+        try:
+            yield db
+        finally:
+            try:
+                self.pool.put_nowait(db)
+            except queue.Full:
+                db.close()
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Borrow a pooled connection inside a write transaction"""
+        with self.connection() as db:
+            db.execute('BEGIN IMMEDIATE')
+            try:
+                yield db
+            except BaseException:
+                db.execute('ROLLBACK')
+                raise
+            db.execute('COMMIT')
+
+    def get(self, session_id):
+        """Get a session's messages, or None if unknown or expired"""
+        now = time.time()
+        with self.connection() as db:
+            touched = db.execute('UPDATE sessions SET last_access = ? WHERE id = ? AND last_access >= ?',
+                                 (now, session_id, now - self.ttl)).rowcount
+            if not touched:
+                return None
+            rows = db.execute('SELECT body FROM messages WHERE session_id = ? ORDER BY seq',
+                              (session_id,)).fetchall()
+        return [json_loads(body) for body, in rows]
+
+    def get_or_create(self, session_id):
+        """Get a session's messages, starting an empty session if needed"""
+        history = self.get(session_id)
+        if history is None:
+            with self.transaction() as db:
+                self.evict(db, time.time())
+                db.execute('INSERT OR REPLACE INTO sessions (id, last_access) VALUES (?, ?)',
+                           (session_id, time.time()))
+                db.execute('DELETE FROM messages WHERE session_id = ?', (session_id,))
+            history = []
+        return history
+
+    def append(self, session_id, message):
+        """Add a message to a session's history, keeping the newest SESSION_HISTORY_LIMIT"""
+        now = time.time()
+        with self.transaction() as db:
+            touched = db.execute('UPDATE sessions SET last_access = ? WHERE id = ? AND last_access >= ?',
+                                 (now, session_id, now - self.ttl)).rowcount
+            if not touched:
+                self.evict(db, now)
+                db.execute('INSERT OR REPLACE INTO sessions (id, last_access) VALUES (?, ?)', (session_id, now))
+                db.execute('DELETE FROM messages WHERE session_id = ?', (session_id,))
+            db.execute('INSERT INTO messages (session_id, body) VALUES (?, ?)',
+                       (session_id, json_bytes(message)))
+            db.execute('DELETE FROM messages WHERE session_id = ? AND seq <= '
+                       '(SELECT seq FROM messages WHERE session_id = ? ORDER BY seq DESC LIMIT 1 OFFSET ?)',
+                       (session_id, session_id, SESSION_HISTORY_LIMIT))
+
+    def evict(self, db, now):
+        """Drop expired sessions and the least recently used beyond the limit"""
+        # Both halves walk the last_access index, and messages are removed per
+        # session through messages_session rather than by scanning the table
+        evicted = db.execute('SELECT id FROM sessions WHERE last_access < ? UNION '
+                             'SELECT id FROM (SELECT id FROM sessions ORDER BY last_access DESC LIMIT -1 OFFSET ?)',
+                             (now - self.ttl, self.limit - 1)).fetchall()
+        if evicted:
+            db.executemany('DELETE FROM sessions WHERE id = ?', evicted)
+            db.executemany('DELETE FROM messages WHERE session_id = ?', evicted)
+
+    def ids(self):
+        """List the live session IDs, least recently used first"""
+        with self.connection() as db:
+            rows = db.execute('SELECT id FROM sessions WHERE last_access >= ? ORDER BY last_access',
+                              (time.time() - self.ttl,)).fetchall()
+        return [session_id for session_id, in rows]
+
+    def __len__(self):
+        with self.connection() as db:
+            return db.execute('SELECT COUNT(*) FROM sessions').fetchone()[0]
+
+class SQLiteJobStore:
+    """Improvement job outcomes kept in the session database, so any worker can answer a poll"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            created REAL NOT NULL,
+            status TEXT NOT NULL,
+            body BLOB
+        );
+        CREATE INDEX IF NOT EXISTS jobs_created ON jobs (created);
+    """
+
+    def __init__(self, sessions, limit=IMPROVEMENT_JOB_LIMIT):
+        self.sessions = sessions  # Borrows the session store's connection pool
+        self.limit = limit
+        db = sessions.connect()
+        try:
+            db.executescript(self.SCHEMA)
+        finally:
+            db.close()
+
+    def start(self, job_id):
+        """Record a running job, dropping the oldest beyond the limit"""
+        with self.sessions.transaction() as db:
+            db.execute('INSERT INTO jobs (id, created, status) VALUES (?, ?, ?)', (job_id, time.time(), 'running'))
+            db.execute('DELETE FROM jobs WHERE id IN '
+                       '(SELECT id FROM jobs ORDER BY created DESC LIMIT -1 OFFSET ?)', (self.limit,))
+
+    def finish(self, job_id, status, outcome):
+        """Record a finished job's result or error message"""
+        with self.sessions.connection() as db:
+            db.execute('UPDATE jobs SET status = ?, body = ? WHERE id = ?', (status, json_bytes(outcome), job_id))
+
+    def get(self, job_id):
+        """Get a job's (status, result or error message), or None if unknown"""
+        with self.sessions.connection() as db:
+            row = db.execute('SELECT status, body FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        if row is None:
+            return None
+        status, body = row
+        return status, json_loads(body) if body is not None else None
 
 class ChatLoopAPI:
     def __init__(self):
@@ -26,9 +472,40 @@ class ChatLoopAPI:
             'anthropic': os.environ.get('ANTHROPIC_API_KEY', ''),
             'openai': os.environ.get('OPENAI_API_KEY', '')
         }
+        if self.api_keys['openrouter']:
+            # Fail at startup rather than mid-request if aiohttp is missing
+            load_upstream_modules()
+
+        self.request_rng = random.Random(os.urandom(16))  # Request IDs only, not secrets
+        self.token_pool = bytearray()  # os.urandom bytes handed out for session and job IDs
+        self.token_lock = threading.Lock()
+        self.clock = (0.0, datetime.now(), '', '')  # (monotonic, now, formatted, ISO) refreshed once per second
+        self.health_prefix = (None, b'')  # (clock time, /health body up to the request count)
+        self.http_session = None  # Pooled aiohttp session for upstream calls
+        self.loop = None  # Background event loop, started on first upstream call
+        self.loop_lock = threading.Lock()
+        self.chat_queue = None
+        self.chat_batcher = None
+        self.chat_batches = set()
+        self.upstream_slots = None  # Created on the loop alongside the chat queue
+        self.upstream_cache = OrderedDict()  # normalized prompt -> (expires, completion); loop thread only
+        if hasattr(os, 'register_at_fork'):  # POSIX only; nothing forks elsewhere
+            os.register_at_fork(after_in_child=self.reset_after_fork)
+        self.openrouter_headers = {
+            'Authorization': f'Bearer {self.api_keys["openrouter"]}',
+            'Content-Type': 'application/json',
+            'HTTP-Referer': 'https://ruliad-seed.github.io',
+            'X-Title': 'ChatLoop Interface'
+        }
 
-        self.conversation_history = []
-        self.chat_sessions = {}  # Session persistence
+        # Background jobs for long-running work such as /api/improve
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+        self.improvement_jobs = OrderedDict()  # job_id -> Future, oldest first
+        self.jobs_lock = threading.Lock()
+
+        self.chat_sessions = SQLiteSessionStore(SESSION_DB) if SESSION_DB else SessionStore()  # Session persistence
+        self.job_store = SQLiteJobStore(self.chat_sessions) if SESSION_DB else None  # Job outcomes shared by workers
+        self.stats_lock = threading.Lock()  # Guards system_status counters
         self.system_status = {
             'active': True,
             'version': '2.0.0',
@@ -39,285 +516,403 @@ class ChatLoopAPI:
             'total_sessions': 0
         }
 
+        # Bind the response route handlers once rather than per message
+        self.response_routes = [(getattr(self, name), keywords) for name, keywords in RESPONSE_ROUTES]
+        self.interface_cards = {}  # Rendered endpoint cards for the generated interface
+        self.cached_response = functools.lru_cache(maxsize=RESPONSE_CACHE_SIZE)(self.get_independent_response)
+
+        # Constant payloads are serialized and compressed once instead of on every request
+        self.marketing_body = CachedBody(json_bytes(MARKETING_INFO))
+        self.benchmark_body = CachedBody(json_bytes({
+            'current_metrics': {
+                'accuracy': 100.0,
+                'performance': 85,
+                'memory': 456,
+                'token_efficiency': 0.92
+            },
+            'improvements': {
+                'accuracy_delta': '+27.5%',
+                'performance_delta': '-43% faster',
+                'memory_delta': '-11% usage',
+                'overall': 'significant'
+            },
+            'history': self.get_benchmark_history()
+        }))
+
+        # The landing page only changes on restart; the request counter is refreshed from /health
+        with self.app.app_context():
+            index_html = render_template_string(HTML_TEMPLATE, api=self, python_version=platform.python_version())
+        self.index_body = CachedBody(index_html.encode(), mimetype='text/html', max_age=0)
+
+        # Endpoint cards, curl examples included, are rendered before the first request
+        for endpoint in self.analyze_system_capabilities()['endpoints']:
+            self.render_interface_card(endpoint)
+
         self.setup_routes()
 
     def setup_routes(self):
+        @self.app.errorhandler(500)
+        def internal_error(error):
+            return json_response({'error': 'Internal server error'}, 500)
+
         @self.app.route('/')
         def index():
-            return render_template_string(HTML_TEMPLATE, api=self)
+            return self.index_body.response()
 
         @self.app.route('/health')
         def health():
-            return jsonify({
-                'status': 'healthy',
-                'timestamp': datetime.now().isoformat(),
-                'version': self.system_status['version'],
-                'uptime': str(datetime.now() - self.system_status['uptime']),
-                'requests': self.system_status['requests_processed']
-            })
+            # Everything but the request count changes at most once per second
+            now = self.get_clock()
+            checked, prefix = self.health_prefix
+            if checked is not now:
+                prefix = json_bytes({
+                    'status': 'healthy',
+                    'timestamp': now.isoformat(),
+                    'version': self.system_status['version'],
+                    'uptime': str(now - self.system_status['uptime'])
+                })[:-1] + b',"requests":'
+                self.health_prefix = (now, prefix)
+            body = b'%s%d}' % (prefix, self.system_status['requests_processed'])
+            return Response(body, mimetype='application/json')
 
         @self.app.route('/api/generate', methods=['POST'])
         def generate_system():
-            try:
-                data = request.get_json()
-                if not data or 'component' not in data:
-                    return jsonify({'error': 'Component type required'}), 400
-
-                component = data['component']
-                specifications = data.get('specifications', {})
-
-                # Generate the requested component
-                if component == 'improved_chat':
-                    result = self.generate_improved_chat_interface(specifications)
-                elif component == 'advanced_api':
-                    result = self.generate_advanced_api_server(specifications)
-                elif component == 'self_improvement_engine':
-                    result = self.generate_self_improvement_engine(specifications)
-                else:
-                    return jsonify({'error': 'Unknown component type'}), 400
-
-                return jsonify({
-                    'success': True,
-                    'component': component,
-                    'result': result,
-                    'timestamp': datetime.now().isoformat()
-                })
+            data = read_json()
+            if not isinstance(data, dict) or 'component' not in data:
+                return json_response({'error': 'Component type required'}, 400)
+
+            component = data['component']
+            specifications = data.get('specifications', {})
+
+            # Generate the requested component
+            if component == 'improved_chat':
+                result = self.generate_improved_chat_interface(specifications)
+            elif component == 'advanced_api':
+                result = self.generate_advanced_api_server(specifications)
+            elif component == 'self_improvement_engine':
+                result = self.generate_self_improvement_engine(specifications)
+            else:
+                return json_response({'error': 'Unknown component type'}, 400)
 
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
+            return json_response({
+                'success': True,
+                'component': component,
+                'result': result,
+                'timestamp': self.get_clock_iso()
+            })
 
         @self.app.route('/api/chat', methods=['POST'])
         def chat():
-            try:
-                data = request.get_json()
-                if not data or 'message' not in data:
-                    return jsonify({'error': 'Message required'}), 400
-
-                message = data['message']
-                session_id = data.get('session_id', 'default')
-                context = data.get('context', {})
-                tool_mode = context.get('tool', 'chat')
+            chat_request = read_chat_request()
+            if isinstance(chat_request, Response):
+                return chat_request
+            message, session_id, tool_mode, context_session = chat_request
 
+            with self.stats_lock:
                 self.system_status['requests_processed'] += 1
+            now = self.get_clock_iso()
 
-                # Process based on tool mode
-                if tool_mode == 'generate':
-                    response = self.process_code_generation(message)
-                elif tool_mode == 'improve':
-                    response = self.process_empirical_improvement(message)
-                elif tool_mode == 'benchmark':
-                    response = self.process_benchmarking(message)
-                else:
-                    response = self.process_chat_message(message)
+            # Process based on tool mode
+            if tool_mode in LOCAL_TOOLS:
+                response = self.process_tool_message(tool_mode, message)
+            else:
+                response = self.process_chat_message(message, context_session)
+
+            # Store conversation in session
+            self.chat_sessions.append(session_id, {
+                'timestamp': now,
+                'input': message,
+                'output': response,
+                'mode': tool_mode,
+                'session_id': session_id
+            })
 
-                # Store conversation in session
-                if session_id not in self.chat_sessions:
-                    self.chat_sessions[session_id] = []
+            return json_response({
+                'response': response,
+                'mode': tool_mode,
+                'session_id': session_id,
+                'timestamp': now,
+                'request_id': f'{self.request_rng.getrandbits(64):016x}',
+                'independent_mode': True
+            })
 
-                self.chat_sessions[session_id].append({
-                    'timestamp': datetime.now().isoformat(),
+        @self.app.route('/api/chat/stream', methods=['POST'])
+        def chat_stream():
+            """Stream a chat reply as server-sent events while it is generated"""
+            chat_request = read_chat_request()
+            if isinstance(chat_request, Response):
+                return chat_request
+            message, session_id, tool_mode, context_session = chat_request
+
+            with self.stats_lock:
+                self.system_status['requests_processed'] += 1
+            now = self.get_clock_iso()
+            request_id = f'{self.request_rng.getrandbits(64):016x}'
+
+            if tool_mode in LOCAL_TOOLS:
+                chunks = [self.process_tool_message(tool_mode, message)]
+            else:
+                chunks = self.stream_chat_message(message, context_session)
+
+            def events():
+                parts = []
+                try:
+                    for text in chunks:
+                        parts.append(text)
+                        yield b'data: %s\n\n' % json_bytes({'delta': text})
+                except StreamInterrupted:
+                    # A partial reply is neither stored nor sent upstream as context
+                    yield b'data: %s\n\n' % json_bytes({
+                        'error': 'Reply stream interrupted',
+                        'session_id': session_id,
+                        'request_id': request_id
+                    })
+                    return
+
+                # Store the conversation once the whole reply is known
+                self.chat_sessions.append(session_id, {
+                    'timestamp': now,
                     'input': message,
-                    'output': response,
+                    'output': ''.join(parts),
                     'mode': tool_mode,
                     'session_id': session_id
                 })
-
-                # Keep only last 100 messages per session
-                if len(self.chat_sessions[session_id]) > 100:
-                    self.chat_sessions[session_id] = self.chat_sessions[session_id][-100:]
-
-                return jsonify({
-                    'response': response,
+                yield b'data: %s\n\n' % json_bytes({
+                    'done': True,
                     'mode': tool_mode,
                     'session_id': session_id,
-                    'timestamp': datetime.now().isoformat(),
-                    'request_id': secrets.token_hex(8),
-                    'independent_mode': True
+                    'timestamp': now,
+                    'request_id': request_id
                 })
 
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
+            return Response(events(), mimetype='text/event-stream',
+                            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
         @self.app.route('/api/improve', methods=['POST'])
         def run_improvement():
-            try:
-                # Run empirical improvement process
-                result = self.run_empirical_improvement()
-                self.system_status['last_improvement_run'] = datetime.now().isoformat()
-
-                return jsonify({
-                    'success': True,
-                    'result': result,
-                    'timestamp': datetime.now().isoformat()
-                })
-
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
+            # Run empirical improvement process in the background
+            job_id = self.new_token()
+            if self.job_store is not None:
+                self.job_store.start(job_id)
+            future = self.executor.submit(self.run_improvement_job)
+            if self.job_store is not None:
+                future.add_done_callback(functools.partial(self.record_improvement_job, job_id))
+            with self.jobs_lock:
+                self.improvement_jobs[job_id] = future
+                while len(self.improvement_jobs) > IMPROVEMENT_JOB_LIMIT:
+                    self.improvement_jobs.popitem(last=False)
+
+            return json_response({
+                'success': True,
+                'job_id': job_id,
+                'status': 'running',
+                'status_url': f'/api/improve/{job_id}',
+                'timestamp': self.get_clock_iso()
+            }, 202)
+
+        @self.app.route('/api/improve/<job_id>', methods=['GET'])
+        def get_improvement(job_id):
+            """Get the status or result of an improvement job"""
+            future = self.improvement_jobs.get(job_id)
+            if future is not None:
+                job = self.improvement_outcome(future)
+            else:
+                # Started by another worker, or dropped from this one's table
+                job = self.job_store.get(job_id) if self.job_store is not None else None
+            if job is None:
+                return json_response({'error': 'Job not found'}, 404)
+
+            status, result = job
+            if status == 'running':
+                return json_response({'job_id': job_id, 'status': 'running'})
+            if status == 'failed':
+                return json_response({'job_id': job_id, 'status': 'failed', 'error': result}, 500)
+
+            return json_response({
+                'success': True,
+                'job_id': job_id,
+                'status': 'completed',
+                'result': result,
+                'timestamp': result['timestamp']
+            })
 
         @self.app.route('/api/benchmark', methods=['GET'])
         def get_benchmarks():
-            return jsonify({
-                'current_metrics': {
-                    'accuracy': 100.0,
-                    'performance': 85,
-                    'memory': 456,
-                    'token_efficiency': 0.92
-                },
-                'improvements': {
-                    'accuracy_delta': '+27.5%',
-                    'performance_delta': '-43% faster',
-                    'memory_delta': '-11% usage',
-                    'overall': 'significant'
-                },
-                'history': self.get_benchmark_history()
-            })
+            return self.benchmark_body.response()
 
         @self.app.route('/api/status')
         def get_status():
-            return jsonify(self.system_status)
+            return json_response(self.system_status)
 
         @self.app.route('/api/sessions', methods=['GET'])
         def get_sessions():
             """Get all chat sessions"""
-            return jsonify({
-                'sessions': list(self.chat_sessions.keys()),
-                'total_sessions': len(self.chat_sessions),
+            sessions = self.chat_sessions.ids()
+            return json_response({
+                'sessions': sessions,
+                'total_sessions': len(sessions),
                 'current_version': self.system_status['version']
             })
 
         @self.app.route('/api/sessions/<session_id>', methods=['GET'])
         def get_session(session_id):
             """Get specific chat session"""
-            if session_id in self.chat_sessions:
-                return jsonify({
+            history = self.chat_sessions.get(session_id)
+            if history is not None:
+                messages = list(history)
+                return json_response({
                     'session_id': session_id,
-                    'messages': self.chat_sessions[session_id],
-                    'message_count': len(self.chat_sessions[session_id])
+                    'messages': messages,
+                    'message_count': len(messages)
                 })
             else:
-                return jsonify({'error': 'Session not found'}), 404
+                return json_response({'error': 'Session not found'}, 404)
 
         @self.app.route('/api/sessions', methods=['POST'])
         def create_session():
             """Create new chat session"""
-            session_id = secrets.token_hex(8)
-            self.chat_sessions[session_id] = []
-            self.system_status['total_sessions'] += 1
+            session_id = self.new_token()
+            self.chat_sessions.get_or_create(session_id)
+            with self.stats_lock:
+                self.system_status['total_sessions'] += 1
 
-            return jsonify({
+            return json_response({
                 'session_id': session_id,
-                'created': datetime.now().isoformat(),
+                'created': self.get_clock_iso(),
                 'status': 'active'
             })
 
         @self.app.route('/api/autogenerate/interface')
         def autogenerate_interface():
             """Auto-generate complete interface for all system capabilities"""
-            try:
-                # Analyze all available routes and capabilities
-                interface_data = self.analyze_system_capabilities()
-
-                # Generate complete HTML interface
-                generated_html = self.generate_complete_interface(interface_data)
-
-                return jsonify({
-                    'success': True,
-                    'interface_generated': True,
-                    'capabilities_detected': len(interface_data['endpoints']),
-                    'features_included': interface_data['features'],
-                    'html_preview': generated_html[:500] + '...',  # First 500 chars
-                    'full_interface': generated_html,
-                    'timestamp': datetime.now().isoformat()
-                })
+            # Analyze all available routes and capabilities
+            interface_data = self.analyze_system_capabilities()
+
+            # Generate complete HTML interface
+            generated_html = self.generate_complete_interface(interface_data)
+
+            return json_response({
+                'success': True,
+                'interface_generated': True,
+                'capabilities_detected': len(interface_data['endpoints']),
+                'features_included': interface_data['features'],
+                'html_preview': generated_html[:500] + '...',  # First 500 chars
+                'full_interface': generated_html,
+                'timestamp': self.get_clock_iso()
+            })
 
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
+        @self.app.route('/api/autogenerate/interface.html')
+        def autogenerate_interface_html():
+            """Stream the auto-generated interface as HTML"""
+            interface_data = self.analyze_system_capabilities()
+            return Response(
+                stream_with_context(self.iter_complete_interface(interface_data)),
+                mimetype='text/html',
+                headers={
+                    'X-Capabilities-Detected': str(len(interface_data['endpoints'])),
+                    'X-Features-Included': str(len(interface_data['features']))
+                }
+            )
+
+        @self.app.route('/api/cache/stats')
+        def get_cache_stats():
+            """Get hit/miss statistics for the local response cache"""
+            return json_response(self.cached_response.cache_info()._asdict())
 
         @self.app.route('/api/marketing')
         def get_marketing():
             """Get marketing information about the Ruliadic Seed system"""
-            return jsonify({
-                'title': 'Ruliadic Seed - Self-Generating AI System',
-                'tagline': 'The Complete Self-Generating AI That Creates Improved Versions of Itself',
-                'version': '2.0.0',
-                'capabilities': {
-                    'self_generation': {
-                        'title': 'Self-Generation Capabilities',
-                        'description': 'Advanced AI system that generates complete, improved versions of itself',
-                        'features': [
-                            'Self-Improving Chat Interface - Generates enhanced versions with real-time collaboration',
-                            'Advanced API Server - Creates optimized servers with auto-scaling and monitoring',
-                            'Self-Improvement Engine - Builds systems that continuously optimize themselves'
-                        ]
-                    },
-                    'code_generation': {
-                        'title': 'Advanced Code Generation',
-                        'description': 'Generates actual, working code with production-ready features',
-                        'example': '''class SelfImprovingChat {
-    async improveResponseQuality() {
-        // Analyze current responses
-        // Generate improved algorithms
-        // Deploy updates automatically
-        return { quality: '+45%', speed: '-60%' };
-    }
-}'''
-                    },
-                    'interface_features': {
-                        'title': 'Enhanced Interface Features',
-                        'description': 'One-click generation with intelligent contextual responses',
-                        'features': [
-                            'Generate Improved Chat button - Creates enhanced chat interface',
-                            'Generate Advanced API button - Builds optimized API server',
-                            'Generate Self-Improvement Engine button - Creates auto-optimizing system',
-                            'Smart Contextual Responses - Understands context and provides relevant answers'
-                        ]
-                    }
-                },
-                'endpoints': [
-                    '/api/chat - Intelligent contextual chat responses',
-                    '/api/generate - Actual code generation for system components',
-                    '/api/improve - System improvement processes',
-                    '/api/benchmark - Performance measurement',
-                    '/api/marketing - This marketing information'
-                ],
-                'access_points': {
-                    'web_interface': 'http://localhost:8081/bootstrap.html',
-                    'api_server': 'http://localhost:5000',
-                    'health_check': 'http://localhost:5000/health'
-                },
-                'benefits': [
-                    'Generate improved versions of itself automatically',
-                    'Create complete applications from scratch',
-                    'Optimize existing codebases intelligently',
-                    'Deploy production-ready systems',
-                    'Track performance improvements continuously',
-                    'No API costs - uses free Grok model from xAI'
-                ],
-                'quick_start': [
-                    'Open http://localhost:8081/bootstrap.html in your browser',
-                    'Try the generation buttons for one-click component creation',
-                    'Ask "Generate an improved version of this system"',
-                    'Request "Create a better chat interface"',
-                    'Command "Build a self-improving system"'
-                ],
-                'technical_specs': {
-                    'model': 'Grok (xAI) - Free Tier',
-                    'language': 'Python/JavaScript',
-                    'architecture': 'Self-generating, self-improving',
-                    'deployment': 'Local development servers',
-                    'scalability': 'Auto-optimizing and self-scaling'
-                }
-            })
-
-    def process_chat_message(self, message):
-        """Process general chat messages - completely independent system"""
-        # Use intelligent local responses - no external dependencies
+            return self.marketing_body.response()
+
+    def new_token(self):
+        """Get an unguessable 16-hex-digit ID, reading os.urandom in 4KB batches"""
+        with self.token_lock:
+            if len(self.token_pool) < 8:
+                self.token_pool[:] = os.urandom(4096)
+            token = self.token_pool[-8:]
+            del self.token_pool[-8:]
+        return token.hex()
+
+    def get_chat_context(self, session_id):
+        """Get a session's last CHAT_CONTEXT_TURNS exchanges as (role, content) pairs"""
+        history = self.chat_sessions.get(session_id)
+        if not history:
+            return ()
+        turns = list(history)[-CHAT_CONTEXT_TURNS:]
+        return tuple(pair for turn in turns for pair in (('user', turn['input']), ('assistant', turn['output'])))
+
+    def get_clock(self):
+        """Get the current time, refreshed at most once per second"""
+        return self.tick()[1]
+
+    def get_clock_str(self):
+        """Get the current time as '%Y-%m-%d %H:%M:%S', formatted at most once per second"""
+        return self.tick()[2]
+
+    def get_clock_iso(self):
+        """Get the current time in ISO 8601, formatted at most once per second"""
+        return self.tick()[3]
+
+    def tick(self):
+        """Refresh the cached clock if it is more than a second old"""
+        clock = self.clock
+        if time.monotonic() - clock[0] >= 1.0:
+            now = datetime.now()
+            clock = (time.monotonic(), now, now.strftime('%Y-%m-%d %H:%M:%S'), now.isoformat())
+            self.clock = clock
+        return clock
+
+    def process_tool_message(self, tool_mode, message):
+        """Answer a message for one of the LOCAL_TOOLS"""
+        if tool_mode == 'generate':
+            return self.process_code_generation(message)
+        elif tool_mode == 'improve':
+            return self.process_empirical_improvement(message)
+        return self.process_benchmarking(message)
+
+    def stream_chat_message(self, message, session_id=None):
+        """Yield a chat reply in pieces as OpenRouter generates it"""
+        if not self.api_keys['openrouter']:
+            yield self.process_chat_message(message)
+            return
+
+        context = self.get_chat_context(session_id) if session_id else ()
+        streamed = False
+        try:
+            for text in self.stream_chat(message, context):
+                streamed = True
+                yield text
+        except (aiohttp.ClientError, asyncio.TimeoutError, concurrent.futures.TimeoutError,
+                KeyError, IndexError, ValueError) as error:
+            # Malformed replies from OpenRouter raise KeyError, IndexError or ValueError (bad JSON)
+            if streamed:
+                logger.warning('OpenRouter stream interrupted: %r', error)
+                raise StreamInterrupted from error
+            logger.warning('OpenRouter stream failed, using fallback response: %r', error)
+            yield self.get_fallback_response(message)
+
+    def process_chat_message(self, message, session_id=None):
+        """Process general chat messages via OpenRouter when configured"""
+        if self.api_keys['openrouter']:
+            context = self.get_chat_context(session_id) if session_id else ()
+            try:
+                return self.complete_chat(message, context)
+            except (aiohttp.ClientError, asyncio.TimeoutError, concurrent.futures.TimeoutError,
+                    KeyError, IndexError, ValueError) as error:
+                logger.warning('OpenRouter request failed, using fallback response: %r', error)
+                return self.get_fallback_response(message)
+
+        # Use intelligent local responses - no external dependencies. Keyed
+        # on the exact message, since some responses quote it back
+        if len(message) <= RESPONSE_CACHE_MAX_MESSAGE:
+            return self.cached_response(message)
         return self.get_independent_response(message)
 
     def process_code_generation(self, message):
         """Process code generation requests"""
-        if 'generate' in message.lower() or 'create' in message.lower():
-            language = self.extract_language(message)
+        message_lower = message.lower()
+        if 'generate' in message_lower or 'create' in message_lower:
+            language = self.extract_language(message, message_lower)
             description = self.extract_description(message)
 
             return f"""⚡ **Generating {language} Code**
@@ -343,67 +938,212 @@ Would you like me to modify this or generate something else?"""
 
     def process_empirical_improvement(self, message):
         """Process empirical improvement requests"""
-        if 'improve' in message.lower() or 'empirical' in message.lower():
-            return """📈 **Empirical Improvement Results**
-
-**Latest CI Run Results:**
-- **Accuracy Improvement**: 72.5% → 100% (+27.5%)
-- **Performance Boost**: 150ms → 85ms (-43% faster)
-- **Memory Optimization**: 512MB → 456MB (-11% usage)
-- **Token Efficiency**: 0.75 → 0.92 (+23%)
-
-**Improvement Process:**
-1. ✅ Baseline measurement completed
-2. ✅ Heuristic refinement (200 data points) executed
-3. ✅ Meta-learning (50 iterations) applied
-4. ✅ Final benchmarking validated
-5. ✅ Reports and notifications generated
-
-The system has successfully demonstrated empirical self-improvement! 🎉"""
+        message_lower = message.lower()
+        if 'improve' in message_lower or 'empirical' in message_lower:
+            return EMPIRICAL_IMPROVEMENT_RESPONSE
 
-        return "I can run empirical improvement processes that demonstrate 72.5%→100% accuracy improvement. Try: 'run empirical improvement'"
+        return EMPIRICAL_IMPROVEMENT_HINT
 
     def process_benchmarking(self, message):
         """Process benchmarking requests"""
-        return """📊 **Performance Benchmarks**
-
-**Current System Metrics:**
-| Metric | Value | Status |
-|--------|-------|--------|
-| Accuracy | 100.0% | ✅ Optimal |
-| Response Time | 85ms | ✅ Excellent |
-| Memory Usage | 456MB | ✅ Efficient |
-| Token Ratio | 0.92 | ✅ High Efficiency |
-
-**Historical Trends:**
-- **Last 7 days**: +15% overall improvement
-- **Last 30 days**: +27.5% accuracy improvement
-- **Benchmark runs**: 15 successful cycles
-
-**System Health:**
-- 🏥 Diagnostics: All systems operational
-- 🔬 Pattern mining: Active and learning
-- 📈 Meta-learning: Continuous adaptation
-- 🔔 Notifications: Milestones achieved"""
-
-    async def call_openrouter_api(self, message):
-        """Call OpenRouter API for enhanced responses"""
-        url = "https://openrouter.ai/api/v1/chat/completions"
-
-        headers = {
-            'Authorization': f'Bearer {self.api_keys["openrouter"]}',
-            'Content-Type': 'application/json',
-            'HTTP-Referer': 'https://ruliad-seed.github.io',
-            'X-Title': 'ChatLoop Interface'
-        }
-
-        data = {
+        return BENCHMARK_REPORT
+
+    def reset_after_fork(self):
+        """Drop per-process state inherited from the parent, whose threads did not survive the fork"""
+        self.token_pool.clear()  # Never share IDs across workers
+        self.token_lock = threading.Lock()
+        self.request_rng.seed(os.urandom(16))
+        # The parent's loop and session cannot be closed from here; keep them
+        # referenced so their finalizers never run against a dead loop
+        self.inherited_upstream = (self.loop, self.http_session)
+        self.loop = None
+        self.loop_lock = threading.Lock()
+        self.http_session = None
+        self.chat_queue = None
+        self.chat_batcher = None
+        self.chat_batches = set()
+        self.upstream_slots = None
+
+    def warm_upstream(self):
+        """Open the pooled OpenRouter connection ahead of the first chat request"""
+        if self.api_keys['openrouter']:
+            loop = self.get_event_loop()
+            asyncio.run_coroutine_threadsafe(self.warm_http_session(), loop)
+
+    async def warm_http_session(self):
+        """Resolve DNS and complete the TLS handshake so the connection is pooled"""
+        session = await self.get_http_session()
+        try:
+            async with session.head(OPENROUTER_WARMUP_URL) as response:
+                logger.info('OpenRouter connection warmed (HTTP %d)', response.status)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            logger.warning('OpenRouter warm-up failed: %r', error)
+
+    def get_event_loop(self):
+        """Get the background event loop, starting it on first use"""
+        load_upstream_modules()
+        with self.loop_lock:
+            if self.loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, daemon=True).start()
+                asyncio.run_coroutine_threadsafe(self.start_chat_batcher(), loop).result()
+                self.loop = loop
+                atexit.register(self.stop_event_loop)
+        return self.loop
+
+    def stop_event_loop(self):
+        """Close the pooled upstream connections and stop the background loop"""
+        loop = self.loop
+        if loop is None or not loop.is_running():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.stop_chat_batcher(), loop).result(5)
+        except concurrent.futures.TimeoutError:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+
+    async def start_chat_batcher(self):
+        """Create the chat queue and its batcher on the running loop"""
+        self.chat_queue = asyncio.Queue()
+        self.upstream_slots = asyncio.Semaphore(OPENROUTER_MAX_CONCURRENCY)
+        self.chat_batcher = asyncio.ensure_future(self.run_chat_batcher())
+
+    async def stop_chat_batcher(self):
+        """Cancel the batcher and close the shared session"""
+        self.chat_batcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self.chat_batcher
+        await self.close_http_session()
+
+    async def run_chat_batcher(self):
+        """Drain queued chat prompts and dispatch them in batches"""
+        while True:
+            batch = [await self.chat_queue.get()]
+            if self.chat_queue.qsize() < CHAT_BATCH_MAX - 1:
+                await asyncio.sleep(CHAT_BATCH_WINDOW)
+            while len(batch) < CHAT_BATCH_MAX and not self.chat_queue.empty():
+                batch.append(self.chat_queue.get_nowait())
+
+            task = asyncio.ensure_future(self.dispatch_chat_batch(batch))
+            self.chat_batches.add(task)
+            task.add_done_callback(self.chat_batches.discard)
+
+    async def dispatch_chat_batch(self, batch):
+        """Send a batch of prompts concurrently and resolve their futures"""
+        # Identical prompts in one batch share a single upstream call
+        waiting = {}
+        for message, context, future in batch:
+            waiting.setdefault((message, context), []).append(future)
+
+        results = await asyncio.gather(
+            *(self.call_openrouter_api(message, context) for message, context in waiting),
+            return_exceptions=True
+        )
+        for futures, result in zip(waiting.values(), results):
+            for future in futures:
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    async def queue_chat(self, message, context=()):
+        """Queue a prompt for the batcher and wait for its response"""
+        # Completions that depended on earlier turns are neither reused nor cached
+        cached = None if context else self.get_cached_completion(message)
+        if cached is not None:
+            return cached
+        future = asyncio.get_running_loop().create_future()
+        await self.chat_queue.put((message, context, future))
+        return await future
+
+    def get_cached_completion(self, message):
+        """Get a fresh upstream completion for an equivalent prompt, if any"""
+        key = ' '.join(message.lower().split())
+        entry = self.upstream_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self.upstream_cache[key]
+            return None
+        self.upstream_cache.move_to_end(key)
+        return entry[1]
+
+    def cache_completion(self, message, completion):
+        """Remember an upstream completion, evicting the least recently used"""
+        key = ' '.join(message.lower().split())
+        self.upstream_cache[key] = (time.monotonic() + UPSTREAM_CACHE_TTL, completion)
+        self.upstream_cache.move_to_end(key)
+        if len(self.upstream_cache) > UPSTREAM_CACHE_SIZE:
+            self.upstream_cache.popitem(last=False)
+
+    def complete_chat(self, message, context=(), timeout=60):
+        """Get an upstream chat completion from a request thread"""
+        loop = self.get_event_loop()
+        future = asyncio.run_coroutine_threadsafe(self.queue_chat(message, context), loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def stream_chat(self, message, context=(), timeout=OPENROUTER_STREAM_IDLE):
+        """Yield upstream completion text from a request thread as it arrives"""
+        loop = self.get_event_loop()
+        chunks = queue.SimpleQueue()
+        future = asyncio.run_coroutine_threadsafe(self.pump_chat_stream(message, context, chunks), loop)
+        try:
+            while True:
+                try:
+                    text = chunks.get(timeout=timeout)
+                except queue.Empty:
+                    raise concurrent.futures.TimeoutError from None
+                if text is None:
+                    break
+                yield text
+            future.result(timeout)  # Re-raise anything that ended the stream early
+        finally:
+            future.cancel()
+
+    async def pump_chat_stream(self, message, context, chunks):
+        """Feed streamed completion text into a thread-safe queue, then None"""
+        try:
+            async for text in self.stream_openrouter_api(message, context):
+                chunks.put(text)
+        finally:
+            chunks.put(None)
+
+    async def get_http_session(self):
+        """Get the shared aiohttp session, creating it on first use"""
+        # No await between the check and the assignment, so callers on the loop cannot race
+        if self.http_session is None or self.http_session.closed:
+            self.http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=OPENROUTER_MAX_CONCURRENCY,
+                    keepalive_timeout=60,  # Hold idle connections across chat bursts
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=60, connect=10)
+            )
+        return self.http_session
+
+    async def close_http_session(self):
+        """Close the shared aiohttp session and its pooled connections"""
+        if self.http_session is not None:
+            await self.http_session.close()
+            self.http_session = None
+
+    def openrouter_request(self, message, context=()):
+        """Build the OpenRouter chat completion request body"""
+        # Earlier turns keep their order, so the prompt prefix is stable across a session
+        return {
             'model': 'x-ai/grok-4-fast:free',  # Free Grok-4 Fast model
             'messages': [
-                {
-                    'role': 'system',
-                    'content': 'You are Grok, a helpful AI assistant built by xAI, integrated with the Ruliad-Seed ChatLoop interface. You have access to real-time information and can help with code generation, system improvement, and technical assistance. You are maximally truthful and helpful.'
-                },
+                OPENROUTER_SYSTEM_MESSAGE,
+                *({'role': role, 'content': content} for role, content in context),
                 {
                     'role': 'user',
                     'content': message
@@ -413,13 +1153,70 @@ The system has successfully demonstrated empirical self-improvement! 🎉"""
             'temperature': 0.7
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=data) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result['choices'][0]['message']['content']
-                else:
-                    return self.get_smart_fallback_response(message)
+    @contextlib.asynccontextmanager
+    async def openrouter_response(self, data, timeout=None):
+        """POST a request to OpenRouter within the concurrency limit, retrying 429s"""
+        session = await self.get_http_session()
+        body = json_bytes(data)
+        options = {} if timeout is None else {'timeout': timeout}  # Default: the session's timeout
+        for attempt in range(OPENROUTER_RETRIES + 1):
+            async with self.upstream_slots:
+                async with session.post(OPENROUTER_URL, headers=self.openrouter_headers, data=body,
+                                        **options) as response:
+                    if response.status != 429 or attempt == OPENROUTER_RETRIES:
+                        yield response
+                        return
+                    delay = retry_delay(response.headers.get('Retry-After'), attempt)
+            # Back off without holding a slot, so other prompts can proceed
+            await asyncio.sleep(delay)
+
+    async def call_openrouter_api(self, message, context=()):
+        """Call OpenRouter API for enhanced responses"""
+        data = self.openrouter_request(message, context)
+        async with self.openrouter_response(data) as response:
+            if response.status == 200:
+                result = await response.json(loads=json_loads)
+                completion = result['choices'][0]['message']['content']
+                if not context:
+                    self.cache_completion(message, completion)
+                return completion
+            else:
+                return self.get_fallback_response(message)
+
+    async def stream_openrouter_api(self, message, context=()):
+        """Call OpenRouter with streaming, yielding completion text as it arrives"""
+        cached = None if context else self.get_cached_completion(message)
+        if cached is not None:
+            yield cached
+            return
+
+        data = self.openrouter_request(message, context)
+        data['stream'] = True
+        # Long generations outlive the session's 60s total; only an idle stream times out
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=OPENROUTER_STREAM_IDLE)
+        async with self.openrouter_response(data, timeout) as response:
+            if response.status != 200:
+                yield self.get_fallback_response(message)
+                return
+
+            parts = []
+            async for line in response.content:
+                # Server-sent events; lines without data are keep-alive comments
+                if not line.startswith(b'data: '):
+                    continue
+                payload = line[6:].strip()
+                if payload == b'[DONE]':
+                    break
+                text = json_loads(payload)['choices'][0]['delta'].get('content')
+                if text:
+                    parts.append(text)
+                    yield text
+            else:
+                # The connection closed before the end marker, so the reply is cut short
+                raise aiohttp.ClientPayloadError('OpenRouter stream ended before [DONE]')
+
+        if parts and not context:
+            self.cache_completion(message, ''.join(parts))
 
     def get_fallback_response(self, message):
         """Provide intelligent fallback responses when API is unavailable"""
@@ -428,101 +1225,432 @@ The system has successfully demonstrated empirical self-improvement! 🎉"""
             f"💡 System Integration: '{message}' - I can process this through multiple tools including empirical improvement and benchmarking.",
             f"🔧 Technical Assistant: Processing '{message}' with available system tools and capabilities."
         ]
-        return responses[hash(message) % len(responses)]
+        # crc32 is cheap and, unlike hash(), stable across restarts
+        return responses[zlib.crc32(message.encode()) % len(responses)]
 
     def get_independent_response(self, message):
         """Provide intelligent responses - completely independent system"""
         message_lower = message.lower()
 
-        # Self-generation and improvement requests
-        if any(word in message_lower for word in ['generate', 'create', 'build', 'improve', 'better', 'system']):
-            return self.get_self_generation_response(message)
-
-        # Code and development requests
-        if any(word in message_lower for word in ['code', 'python', 'javascript', 'react', 'api', 'function']):
-            return self.get_code_response(message)
-
-        # Technical questions
-        if any(word in message_lower for word in ['how', 'what', 'why', 'explain', 'help', 'debug']):
-            return self.get_help_response(message)
-
-        # Suggestions and recommendations
-        if any(word in message_lower for word in ['suggest', 'recommend', 'idea', 'feature']):
-            return self.get_suggestion_response(message)
-
-        # System status and capabilities
-        if any(word in message_lower for word in ['status', 'version', 'work', 'do', 'can']):
-            return self.get_system_response(message)
+        for handler, keywords in self.response_routes:
+            if any(word in message_lower for word in keywords):
+                return handler(message, message_lower)
 
         # Default contextual response
         return self.get_contextual_response(message)
 
     def get_contextual_response(self, message):
         """Provide contextual responses based on conversation history"""
-        return f"""🤖 **Ruliadic Seed Independent AI**
+        return CONTEXTUAL_RESPONSE_PREFIX + message + CONTEXTUAL_RESPONSE_SUFFIX
 
-**Your Message:** "{message}"
+    def get_code_response(self, message, message_lower=None):
+        """Generate code-related responses"""
+        if message_lower is None:
+            message_lower = message.lower()
 
-**My Response:** I'm a completely independent AI system that operates without external API dependencies. I can help you with:
+        if 'python' in message_lower:
+            return PYTHON_CODE_RESPONSE
+        elif 'javascript' in message_lower or 'js' in message_lower:
+            return JAVASCRIPT_CODE_RESPONSE
+        elif 'self' in message_lower or 'generate' in message_lower or 'system' in message_lower:
+            return SELF_GENERATION_CODE_RESPONSE
+        else:
+            return CODE_CAPABILITIES_RESPONSE
+
+    def get_help_response(self, message, message_lower=None):
+        """Generate help and explanation responses"""
+        return HELP_RESPONSE
+
+    def get_suggestion_response(self, message, message_lower=None):
+        """Generate suggestion and recommendation responses"""
+        return SUGGESTION_RESPONSE
+
+    def get_system_response(self, message, message_lower=None):
+        """Generate system status and capability responses"""
+        return SYSTEM_RESPONSE
+
+    def get_self_generation_response(self, message, message_lower=None):
+        """Generate self-improving system responses"""
+        return SELF_GENERATION_RESPONSE
+
+    def analyze_system_capabilities(self):
+        """Analyze all available system capabilities and endpoints"""
+        capabilities = {
+            'endpoints': [
+                {
+                    'path': '/api/chat',
+                    'method': 'POST',
+                    'description': 'Main chat interface with session persistence',
+                    'features': ['session_management', 'independent_responses', 'contextual_ai']
+                },
+                {
+                    'path': '/api/generate',
+                    'method': 'POST',
+                    'description': 'Generate system components and code',
+                    'features': ['code_generation', 'system_components', 'self_improvement']
+                },
+                {
+                    'path': '/api/sessions',
+                    'method': 'GET/POST',
+                    'description': 'Session management and persistence',
+                    'features': ['session_persistence', 'conversation_history', 'multi_session']
+                },
+                {
+                    'path': '/api/marketing',
+                    'method': 'GET',
+                    'description': 'System marketing and capability information',
+                    'features': ['system_overview', 'feature_listing', 'technical_specs']
+                },
+                {
+                    'path': '/api/autogenerate/interface',
+                    'method': 'GET',
+                    'description': 'Auto-generate complete interface for all capabilities',
+                    'features': ['interface_generation', 'capability_discovery', 'dynamic_ui']
+                }
+            ],
+            'features': [
+                'independent_operation',
+                'session_persistence',
+                'self_generation',
+                'code_generation',
+                'system_optimization',
+                'marketing_capabilities',
+                'interface_autogeneration',
+                'multi_language_support',
+                'real_time_responses',
+                'contextual_understanding'
+            ],
+            'system_info': {
+                'name': 'Ruliadic Seed',
+                'version': self.system_status['version'],
+                'independent_mode': self.system_status['independent_mode'],
+                'total_sessions': self.system_status['total_sessions'],
+                'uptime': str(self.get_clock() - self.system_status['uptime'])
+            }
+        }
+        return capabilities
+
+    def generate_complete_interface(self, interface_data):
+        """Generate complete HTML interface for all system capabilities"""
+        return ''.join(self.iter_complete_interface(interface_data))
+
+    def iter_complete_interface(self, interface_data):
+        """Yield the generated HTML interface in chunks, endpoint by endpoint"""
+        system_info = interface_data['system_info']
+        yield INTERFACE_PAGE_HEAD.format(version=system_info['version'])
+        yield INTERFACE_STYLE
+        yield INTERFACE_OVERVIEW.format(
+            version=system_info['version'],
+            independent_mode='✅ Active' if system_info['independent_mode'] else '❌ Inactive',
+            uptime=system_info['uptime'],
+            features=''.join(map(feature_tag, interface_data['features'])),
+            total_sessions=system_info['total_sessions']
+        )
+
+        # Add each endpoint as a card
+        for endpoint in interface_data['endpoints']:
+            yield self.render_interface_card(endpoint)
+
+        yield INTERFACE_QUICK_START
+        yield INTERFACE_FOOTER.format(
+            endpoints=len(interface_data['endpoints']),
+            feature_count=len(interface_data['features']),
+            generated=self.get_clock_str(),
+            version=system_info['version']
+        )
+
+    def render_interface_card(self, endpoint):
+        """Render an endpoint card, reusing the cached HTML when unchanged"""
+        key = (endpoint['path'], endpoint['method'], endpoint['description'], tuple(endpoint['features']))
+        card = self.interface_cards.get(key)
+        if card is None:
+            card = INTERFACE_CARD.format(
+                method=endpoint['method'],
+                path=endpoint['path'],
+                description=endpoint['description'],
+                features=''.join(map(feature_tag, endpoint['features']))
+            )
+            self.interface_cards[key] = card
+        return card
+
+    def generate_improved_chat_interface(self, specifications):
+        """Generate an improved chat interface"""
+        return {
+            'component': 'improved_chat_interface',
+            'version': '2.0.0',
+            'features': [
+                'real_time_collaboration',
+                'voice_integration',
+                'advanced_syntax_highlighting',
+                'plugin_system',
+                'auto_complete',
+                'mobile_responsive'
+            ],
+            'code': '''
+class SelfImprovingChat {
+    constructor() {
+        this.features = [
+            'real_time_collaboration',
+            'voice_integration',
+            'advanced_syntax_highlighting',
+            'plugin_system'
+        ];
+        this.performanceMetrics = new Map();
+    }
+
+    async improveResponseQuality() {
+        // Analyze current responses
+        const analysis = await this.analyzeResponses();
+        // Generate improved algorithms
+        const improvements = await this.generateImprovements(analysis);
+        // Deploy updates automatically
+        return await this.deployImprovements(improvements);
+    }
+
+    async analyzeResponses() {
+        return {
+            averageResponseTime: '167ms',
+            userSatisfaction: 4.8,
+            improvementPotential: 'high'
+        };
+    }
+}
+            ''',
+            'improvements': [
+                'Response quality: +65%',
+                'Processing speed: -75% latency',
+                'Memory efficiency: -45% usage',
+                'Feature completeness: +40%'
+            ]
+        }
+
+    def generate_advanced_api_server(self, specifications):
+        """Generate an advanced API server"""
+        return {
+            'component': 'advanced_api_server',
+            'version': '2.0.0',
+            'features': [
+                'auto_scaling',
+                'advanced_caching',
+                'real_time_monitoring',
+                'load_balancing',
+                'self_optimization',
+                'comprehensive_logging'
+            ],
+            'code': '''
+class AdvancedAPIServer:
+    def __init__(self):
+        self.self_improvement_engine = True
+        self.auto_optimization = True
+        self.performance_monitor = True
+        self.version = "2.0.0"
+
+    async def generate_improvements(self):
+        \"\"\"Generate and deploy system improvements\"\"\"
+
+        # Analyze current performance
+        analysis = await self.analyze_performance()
+
+        # Generate optimized code
+        improvements = await self.create_improvements(analysis)
+
+        # Auto-deploy improvements
+        await self.deploy_improvements(improvements)
+
+        return {
+            "improvements_generated": len(improvements),
+            "performance_impact": "+75%",
+            "deployment_status": "success"
+        }
+
+    async def analyze_performance(self):
+        return {
+            "response_time": "167ms",
+            "memory_usage": "45MB",
+            "cpu_utilization": "23%",
+            "optimization_potential": "high"
+        }
+            ''',
+            'improvements': [
+                'Auto-scaling capabilities',
+                'Redis caching integration',
+                'Grafana monitoring dashboards',
+                'Load balancing algorithms',
+                'Self-optimization engine'
+            ]
+        }
+
+    def generate_self_improvement_engine(self, specifications):
+        """Generate a self-improvement engine"""
+        return {
+            'component': 'self_improvement_engine',
+            'version': '3.0.0',
+            'features': [
+                'continuous_learning',
+                'automatic_optimization',
+                'performance_prediction',
+                'adaptive_scaling',
+                'intelligent_caching',
+                'real_time_analytics'
+            ],
+            'code': '''
+class SelfImprovementEngine:
+    def __init__(self):
+        self.learning_rate = 0.001
+        self.optimization_targets = [
+            "response_quality",
+            "processing_speed",
+            "memory_efficiency",
+            "feature_completeness"
+        ]
+        self.improvement_history = []
+
+    async def continuous_improvement_loop(self):
+        \"\"\"Main self-improvement loop\"\"\"
+
+        while True:
+            # 1. Analyze current performance
+            current_metrics = await self.analyze_current_state()
+
+            # 2. Identify improvement opportunities
+            opportunities = await self.identify_opportunities(current_metrics)
+
+            # 3. Generate improvements
+            improvements = await self.generate_improvements(opportunities)
+
+            # 4. Test improvements
+            test_results = await self.test_improvements(improvements)
+
+            # 5. Deploy if successful
+            if test_results["success"]:
+                await self.deploy_improvements(improvements)
+                self.improvement_history.append({
+                    "timestamp": datetime.now(),
+                    "improvements": improvements,
+                    "impact": test_results["impact"]
+                })
 
-✅ **Self-Generation**: Create improved versions of systems
-✅ **Code Generation**: Build applications in any language
-✅ **System Analysis**: Identify optimization opportunities
-✅ **Technical Support**: Debug and solve development issues
-✅ **Architecture Design**: Plan scalable system structures
+            # 6. Wait before next iteration
+            await asyncio.sleep(3600)  # Check every hour
 
-**Key Features:**
-- 🚀 **Independent Operation**: No external APIs required
-- 💾 **Session Persistence**: Conversations are saved and resumed
-- 🔧 **Self-Improvement**: System continuously optimizes itself
-- 🎯 **Contextual Responses**: Understands and responds to your needs
+    async def analyze_current_state(self):
+        return {
+            "response_quality": 4.2,
+            "processing_speed": 167,
+            "memory_usage": 45.6,
+            "user_satisfaction": 4.1,
+            "system_health": "excellent"
+        }
 
-**Try asking:**
-- "Generate an improved version of this chat system"
-- "Create a Python web application"
-- "How do I optimize this code?"
-- "Show me the current system status"
+    async def identify_opportunities(self, metrics):
+        opportunities = []
 
-I'm ready to help with any development task or technical challenge you have!"""
+        if metrics["processing_speed"] > 150:
+            opportunities.append({
+                "type": "speed_optimization",
+                "potential_impact": "-40% latency",
+                "complexity": "medium"
+            })
 
-    def get_self_generation_response(self, message):
-        """Provide intelligent responses based on message content - no API required"""
-        message_lower = message.lower()
+        if metrics["memory_usage"] > 40:
+            opportunities.append({
+                "type": "memory_optimization",
+                "potential_impact": "-25% usage",
+                "complexity": "low"
+            })
 
-        # Suggestion requests
-        if any(word in message_lower for word in ['suggest', 'recommend', 'advice', 'idea']):
-            return self.get_suggestion_response(message)
+        return opportunities
+            ''',
+            'improvements': [
+                'Continuous learning algorithms',
+                'Automatic performance optimization',
+                'Predictive scaling capabilities',
+                'Adaptive caching strategies',
+                'Real-time analytics and reporting',
+                'Intelligent resource allocation'
+            ]
+        }
 
-        # Code generation requests
-        if any(word in message_lower for word in ['generate', 'create', 'build', 'make', 'code']):
-            return self.get_code_response(message)
+    def extract_language(self, message, message_lower=None):
+        """Extract programming language from message"""
+        if message_lower is None:
+            message_lower = message.lower()
 
-        # Improvement requests
-        elif any(word in message_lower for word in ['improve', 'optimize', 'enhance', 'better', 'upgrade']):
-            return self.get_improvement_response(message)
+        for lang in LANGUAGES:
+            if lang in message_lower:
+                return lang.title()
 
-        # Technical questions
-        elif any(word in message_lower for word in ['how', 'what', 'why', 'explain', 'help', 'tutorial']):
-            return self.get_help_response(message)
+        return 'Python'  # Default
 
-        # Status/questions about the system
-        elif any(word in message_lower for word in ['status', 'system', 'interface', 'work', 'do']):
-            return self.get_system_response(message)
+    def extract_description(self, message):
+        """Extract description from generation request"""
+        # Simple extraction - can be enhanced
+        return message.replace('generate', '').replace('create', '').strip()
 
-        # Self-generation requests
-        elif any(word in message_lower for word in ['self', 'generate', 'create', 'improve', 'system']):
-            return self.get_self_generation_response(message)
+    def run_empirical_improvement(self):
+        """Run the empirical improvement process"""
+        return {
+            'process': 'empirical_improvement',
+            'stages': [
+                'baseline_measurement',
+                'heuristic_refinement',
+                'meta_learning',
+                'final_benchmarking',
+                'report_generation'
+            ],
+            'results': {
+                'accuracy_improvement': '+27.5%',
+                'performance_improvement': '-43%',
+                'memory_optimization': '-11%',
+                'status': 'completed'
+            },
+            'timestamp': self.get_clock_iso()
+        }
 
-        # Default intelligent response
-        else:
-            return self.get_default_response(message)
+    def run_improvement_job(self):
+        """Run empirical improvement and record when it last ran"""
+        result = self.run_empirical_improvement()
+        self.system_status['last_improvement_run'] = result['timestamp']
+        return result
+
+    def improvement_outcome(self, future):
+        """Get an improvement job's (status, result or error message) from its future"""
+        if not future.done():
+            return 'running', None
+        error = future.exception()
+        if error is not None:
+            return 'failed', str(error)
+        return 'completed', future.result()
+
+    def record_improvement_job(self, job_id, future):
+        """Store a finished job's outcome for polls that land on another worker"""
+        self.job_store.finish(job_id, *self.improvement_outcome(future))
 
-    def get_code_response(self, message):
-        """Generate code-related responses"""
-        message_lower = message.lower()
+    def get_benchmark_history(self):
+        """Get historical benchmark data"""
+        return [
+            {
+                'date': '2024-09-30',
+                'accuracy': 100.0,
+                'performance': 85,
+                'memory': 456
+            },
+            {
+                'date': '2024-09-29',
+                'accuracy': 98.5,
+                'performance': 92,
+                'memory': 478
+            },
+            {
+                'date': '2024-09-28',
+                'accuracy': 95.2,
+                'performance': 105,
+                'memory': 492
+            }
+        ]
 
-        if 'python' in message_lower:
-            return """⚡ **Advanced Python Code Generation**
+# Static chat responses, built once at import
+PYTHON_CODE_RESPONSE = """⚡ **Advanced Python Code Generation**
 
 ```python
 import asyncio
@@ -584,8 +1712,7 @@ improvements = await generator.generate_improvement("chat_system")
 print(f"Generated {len(improvements)} improvements")
 ```"""
 
-        elif 'javascript' in message_lower or 'js' in message_lower:
-            return """⚡ **Advanced JavaScript Code Generation**
+JAVASCRIPT_CODE_RESPONSE = """⚡ **Advanced JavaScript Code Generation**
 
 ```javascript
 class RuliadicSeedGenerator {
@@ -645,8 +1772,7 @@ class RuliadicSeedGenerator {
 - Optimizes performance bottlenecks
 - Adds new features dynamically"""
 
-        elif 'self' in message_lower or 'generate' in message_lower or 'system' in message_lower:
-            return """🚀 **Self-Generating System Capabilities**
+SELF_GENERATION_CODE_RESPONSE = """🚀 **Self-Generating System Capabilities**
 
 I can generate complete, improved versions of systems including:
 
@@ -694,8 +1820,7 @@ class AdvancedAPIServer:
 
 Would you like me to generate a complete, improved version of any specific component?"""
 
-        else:
-            return """⚡ **Advanced Code Generation System**
+CODE_CAPABILITIES_RESPONSE = """⚡ **Advanced Code Generation System**
 
 **Multi-Language Support:**
 - **Python** - Full-stack applications, APIs, ML systems
@@ -718,29 +1843,7 @@ Would you like me to generate a complete, improved version of any specific compo
 
 Try: "generate an improved version of this system" or "create a better chat interface" """
 
-    def get_improvement_response(self, message):
-        """Generate improvement-related responses"""
-        return """📈 **System Improvement & Optimization**
-
-**Current Capabilities:**
-- ✅ Code optimization and refactoring
-- ✅ Performance analysis and tuning
-- ✅ Architecture recommendations
-- ✅ Best practices implementation
-- ✅ Automated testing strategies
-- ✅ Security enhancements
-
-**Sample Improvements:**
-- Database query optimization (40% faster)
-- API response time reduction (60% improvement)
-- Memory usage optimization (25% reduction)
-- Code maintainability enhancement
-
-I can analyze your codebase and provide specific improvement recommendations!"""
-
-    def get_help_response(self, message):
-        """Generate help and explanation responses"""
-        return """💡 **Technical Assistance Available**
+HELP_RESPONSE = """💡 **Technical Assistance Available**
 
 I can help you with:
 - **Code Debugging** - Identify and fix issues
@@ -757,9 +1860,7 @@ I can help you with:
 
 What specific technical challenge can I help you solve?"""
 
-    def get_suggestion_response(self, message):
-        """Generate suggestion and recommendation responses"""
-        return """🎯 **Smart Suggestions for Your Ruliadic Seed Interface**
+SUGGESTION_RESPONSE = """🎯 **Smart Suggestions for Your Ruliadic Seed Interface**
 
 Based on your current setup, here are my top recommendations:
 
@@ -789,9 +1890,7 @@ Based on your current setup, here are my top recommendations:
 
 Would you like me to implement any of these specific features? I can start with the most impactful ones!"""
 
-    def get_system_response(self, message):
-        """Generate system status and capability responses"""
-        return """🔧 **Ruliadic Seed System Status**
+SYSTEM_RESPONSE = """🔧 **Ruliadic Seed System Status**
 
 **Current Configuration:**
 - ✅ **Model**: Grok (xAI) - Free Tier
@@ -815,39 +1914,34 @@ Would you like me to implement any of these specific features? I can start with
 
 The system is fully operational and ready for any development or technical tasks you have in mind!"""
 
-    def get_default_response(self, message):
-        """Generate intelligent default responses"""
-        return f"""🤖 **Ruliadic Seed AI Assistant**
+CONTEXTUAL_RESPONSE_PREFIX = """🤖 **Ruliadic Seed Independent AI**
 
-I understand you're asking: **"{message}"**
+**Your Message:** \""""
+CONTEXTUAL_RESPONSE_SUFFIX = """\"
 
-I'm a fully-featured AI development assistant with capabilities including:
+**My Response:** I'm a completely independent AI system that operates without external API dependencies. I can help you with:
 
-**Core Functions:**
-- **Code Generation** - Create applications in any language
-- **Debugging Help** - Fix issues and optimize performance
-- **Architecture Design** - Plan scalable system structures
-- **Technical Writing** - Documentation and explanations
-- **Process Improvement** - Optimize workflows and efficiency
+✅ **Self-Generation**: Create improved versions of systems
+✅ **Code Generation**: Build applications in any language
+✅ **System Analysis**: Identify optimization opportunities
+✅ **Technical Support**: Debug and solve development issues
+✅ **Architecture Design**: Plan scalable system structures
 
-**Available Tools:**
-- 💻 Code generation and refactoring
-- 🔍 System analysis and optimization
-- 📊 Performance benchmarking
-- 🚀 Deployment assistance
-- 🛠️ Technical problem-solving
+**Key Features:**
+- 🚀 **Independent Operation**: No external APIs required
+- 💾 **Session Persistence**: Conversations are saved and resumed
+- 🔧 **Self-Improvement**: System continuously optimizes itself
+- 🎯 **Contextual Responses**: Understands and responds to your needs
 
-**Quick Start Options:**
-1. **"Generate a Python web app"** - Create new applications
-2. **"Improve this algorithm"** - Share code for optimization
-3. **"How do I deploy to AWS?"** - Get technical guidance
-4. **"Debug this error"** - Get help with issues
+**Try asking:**
+- "Generate an improved version of this chat system"
+- "Create a Python web application"
+- "How do I optimize this code?"
+- "Show me the current system status"
 
-What specific task would you like help with? I'm ready to assist with any development challenge!"""
+I'm ready to help with any development task or technical challenge you have!"""
 
-    def get_self_generation_response(self, message):
-        """Generate self-improving system responses"""
-        return """🚀 **Self-Generating AI System**
+SELF_GENERATION_RESPONSE = """🚀 **Self-Generating AI System**
 
 I can generate complete, improved versions of this system with advanced capabilities:
 
@@ -915,131 +2009,118 @@ class SelfImprovingRuliadSeed:
 
 I can generate complete, production-ready systems with advanced features and self-improvement capabilities!"""
 
-    def analyze_system_capabilities(self):
-        """Analyze all available system capabilities and endpoints"""
-        capabilities = {
-            'endpoints': [
-                {
-                    'path': '/api/chat',
-                    'method': 'POST',
-                    'description': 'Main chat interface with session persistence',
-                    'features': ['session_management', 'independent_responses', 'contextual_ai']
-                },
-                {
-                    'path': '/api/generate',
-                    'method': 'POST',
-                    'description': 'Generate system components and code',
-                    'features': ['code_generation', 'system_components', 'self_improvement']
-                },
-                {
-                    'path': '/api/sessions',
-                    'method': 'GET/POST',
-                    'description': 'Session management and persistence',
-                    'features': ['session_persistence', 'conversation_history', 'multi_session']
-                },
-                {
-                    'path': '/api/marketing',
-                    'method': 'GET',
-                    'description': 'System marketing and capability information',
-                    'features': ['system_overview', 'feature_listing', 'technical_specs']
-                },
-                {
-                    'path': '/api/autogenerate/interface',
-                    'method': 'GET',
-                    'description': 'Auto-generate complete interface for all capabilities',
-                    'features': ['interface_generation', 'capability_discovery', 'dynamic_ui']
-                }
-            ],
-            'features': [
-                'independent_operation',
-                'session_persistence',
-                'self_generation',
-                'code_generation',
-                'system_optimization',
-                'marketing_capabilities',
-                'interface_autogeneration',
-                'multi_language_support',
-                'real_time_responses',
-                'contextual_understanding'
-            ],
-            'system_info': {
-                'name': 'Ruliadic Seed',
-                'version': self.system_status['version'],
-                'independent_mode': self.system_status['independent_mode'],
-                'total_sessions': self.system_status['total_sessions'],
-                'uptime': str(datetime.now() - self.system_status['uptime'])
-            }
-        }
-        return capabilities
+# Results returned by the improve chat tool, or a hint when not asked to improve
+EMPIRICAL_IMPROVEMENT_RESPONSE = """📈 **Empirical Improvement Results**
 
-    def generate_complete_interface(self, interface_data):
-        """Generate complete HTML interface for all system capabilities"""
-        html_template = f"""
+**Latest CI Run Results:**
+- **Accuracy Improvement**: 72.5% → 100% (+27.5%)
+- **Performance Boost**: 150ms → 85ms (-43% faster)
+- **Memory Optimization**: 512MB → 456MB (-11% usage)
+- **Token Efficiency**: 0.75 → 0.92 (+23%)
+
+**Improvement Process:**
+1. ✅ Baseline measurement completed
+2. ✅ Heuristic refinement (200 data points) executed
+3. ✅ Meta-learning (50 iterations) applied
+4. ✅ Final benchmarking validated
+5. ✅ Reports and notifications generated
+
+The system has successfully demonstrated empirical self-improvement! 🎉"""
+
+EMPIRICAL_IMPROVEMENT_HINT = "I can run empirical improvement processes that demonstrate 72.5%→100% accuracy improvement. Try: 'run empirical improvement'"
+
+# Benchmark report returned by the benchmark chat tool
+BENCHMARK_REPORT = """📊 **Performance Benchmarks**
+
+**Current System Metrics:**
+| Metric | Value | Status |
+|--------|-------|--------|
+| Accuracy | 100.0% | ✅ Optimal |
+| Response Time | 85ms | ✅ Excellent |
+| Memory Usage | 456MB | ✅ Efficient |
+| Token Ratio | 0.92 | ✅ High Efficiency |
+
+**Historical Trends:**
+- **Last 7 days**: +15% overall improvement
+- **Last 30 days**: +27.5% accuracy improvement
+- **Benchmark runs**: 15 successful cycles
+
+**System Health:**
+- 🏥 Diagnostics: All systems operational
+- 🔬 Pattern mining: Active and learning
+- 📈 Meta-learning: Continuous adaptation
+- 🔔 Notifications: Milestones achieved"""
+
+# Auto-generated interface page. Static sections are yielded as-is; the
+# small dynamic ones are filled in with str.format
+INTERFACE_PAGE_HEAD = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Ruliadic Seed - Auto-Generated Interface v{interface_data['system_info']['version']}</title>
-    <style>
-        * {{
+    <title>Ruliadic Seed - Auto-Generated Interface v{version}</title>
+"""
+
+INTERFACE_STYLE = """    <style>
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             min-height: 100vh;
-        }}
+        }
 
-        .header {{
+        .header {
             background: rgba(255, 255, 255, 0.1);
             backdrop-filter: blur(10px);
             padding: 1rem 2rem;
             text-align: center;
             border-bottom: 1px solid rgba(255, 255, 255, 0.2);
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             padding: 2rem;
-        }}
+        }
 
-        .system-overview {{
+        .system-overview {
             background: rgba(255, 255, 255, 0.1);
             border-radius: 20px;
             padding: 2rem;
             margin-bottom: 2rem;
             border: 1px solid rgba(255, 255, 255, 0.2);
-        }}
+        }
 
-        .capabilities-grid {{
+        .capabilities-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
             gap: 1.5rem;
             margin: 2rem 0;
-        }}
+        }
 
-        .capability-card {{
+        .capability-card {
             background: rgba(255, 255, 255, 0.1);
             border-radius: 15px;
             padding: 1.5rem;
             border: 1px solid rgba(255, 255, 255, 0.2);
-        }}
+        }
 
-        .endpoint-card {{
+        .endpoint-card {
             background: rgba(0, 0, 0, 0.3);
             border-radius: 12px;
             padding: 1rem;
             margin: 1rem 0;
             border-left: 4px solid #4ecdc4;
-        }}
+        }
 
-        .feature-tag {{
+        .feature-tag {
             display: inline-block;
             background: linear-gradient(45deg, #ff6b6b, #4ecdc4);
             color: white;
@@ -1047,9 +2128,9 @@ I can generate complete, production-ready systems with advanced features and sel
             border-radius: 15px;
             font-size: 0.8rem;
             margin: 0.25rem;
-        }}
+        }
 
-        .btn {{
+        .btn {
             background: linear-gradient(45deg, #ff6b6b, #4ecdc4);
             color: white;
             border: none;
@@ -1058,14 +2139,14 @@ I can generate complete, production-ready systems with advanced features and sel
             cursor: pointer;
             font-weight: 600;
             transition: all 0.3s;
-        }}
+        }
 
-        .btn:hover {{
+        .btn:hover {
             transform: translateY(-2px);
             box-shadow: 0 8px 20px rgba(0, 0, 0, 0.3);
-        }}
+        }
 
-        .status-indicator {{
+        .status-indicator {
             display: inline-block;
             width: 12px;
             height: 12px;
@@ -1073,28 +2154,30 @@ I can generate complete, production-ready systems with advanced features and sel
             background: #10b981;
             margin-right: 0.5rem;
             animation: pulse 2s infinite;
-        }}
+        }
 
-        @keyframes pulse {{
-            0%, 100% {{ opacity: 1; }}
-            50% {{ opacity: 0.5; }}
-        }}
+        @keyframes pulse {
+            0%, 100% { opacity: 1; }
+            50% { opacity: 0.5; }
+        }
 
-        .code-example {{
+        .code-example {
             background: rgba(0, 0, 0, 0.4);
             border-radius: 8px;
             padding: 1rem;
             font-family: 'Courier New', monospace;
             overflow-x: auto;
             margin: 1rem 0;
-        }}
+        }
     </style>
 </head>
 <body>
-    <div class="header">
+"""
+
+INTERFACE_OVERVIEW = """    <div class="header">
         <h1>🚀 Ruliadic Seed - Auto-Generated Interface</h1>
-        <p>Version {interface_data['system_info']['version']} | Independent Mode: {'✅ Active' if interface_data['system_info']['independent_mode'] else '❌ Inactive'}</p>
-        <p><span class="status-indicator"></span>System Online | Uptime: {interface_data['system_info']['uptime']}</p>
+        <p>Version {version} | Independent Mode: {independent_mode}</p>
+        <p><span class="status-indicator"></span>System Online | Uptime: {uptime}</p>
     </div>
 
     <div class="container">
@@ -1104,12 +2187,12 @@ I can generate complete, production-ready systems with advanced features and sel
 
             <h3>🔧 Core Features</h3>
             <div>
-                {''.join(f'<span class="feature-tag">{feature.replace("_", " ").title()}</span>' for feature in interface_data['features'])}
+                {features}
             </div>
 
             <h3>📊 System Status</h3>
             <ul>
-                <li><strong>Total Sessions:</strong> {interface_data['system_info']['total_sessions']}</li>
+                <li><strong>Total Sessions:</strong> {total_sessions}</li>
                 <li><strong>Independent Mode:</strong> ✅ Active</li>
                 <li><strong>Self-Generation:</strong> ✅ Enabled</li>
                 <li><strong>Session Persistence:</strong> ✅ Active</li>
@@ -1118,30 +2201,29 @@ I can generate complete, production-ready systems with advanced features and sel
 
         <h2>🔗 Available Endpoints</h2>
         <div class="capabilities-grid">
-"""
-        # Add each endpoint as a card
-        for endpoint in interface_data['endpoints']:
-            html_template += f"""
+"""
+
+INTERFACE_CARD = """
             <div class="capability-card">
-                <h3>{endpoint['method']} {endpoint['path']}</h3>
-                <p>{endpoint['description']}</p>
+                <h3>{method} {path}</h3>
+                <p>{description}</p>
 
                 <h4>Features:</h4>
                 <div>
-                    {''.join(f'<span class="feature-tag">{feature.replace("_", " ").title()}</span>' for feature in endpoint['features'])}
+                    {features}
                 </div>
 
                 <h4>Example Usage:</h4>
                 <div class="code-example">
-# {endpoint['method']} {endpoint['path']}
-curl -X {endpoint['method']} http://localhost:5000{endpoint['path']} \\
+# {method} {path}
+curl -X {method} http://localhost:5000{path} \\
   -H "Content-Type: application/json" \\
   -d '{{"message":"Hello, independent AI!"}}'
                 </div>
             </div>
 """
 
-        html_template += """
+INTERFACE_QUICK_START = """
         </div>
 
         <div class="system-overview">
@@ -1179,282 +2261,99 @@ curl http://localhost:5000/api/autogenerate/interface
             </div>
         </div>
 
-        <div style="text-align: center; margin-top: 3rem; padding: 2rem; background: rgba(255, 255, 255, 0.1); border-radius: 15px;">
+"""
+
+INTERFACE_FOOTER = """        <div style="text-align: center; margin-top: 3rem; padding: 2rem; background: rgba(255, 255, 255, 0.1); border-radius: 15px;">
             <h2>🎉 System Ready!</h2>
-            <p>This interface was auto-generated for all {len(interface_data['endpoints'])} system endpoints and {len(interface_data['features'])} features.</p>
-            <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            <p><strong>Version:</strong> {interface_data['system_info']['version']}</p>
+            <p>This interface was auto-generated for all {endpoints} system endpoints and {feature_count} features.</p>
+            <p><strong>Generated:</strong> {generated}</p>
+            <p><strong>Version:</strong> {version}</p>
         </div>
     </div>
 
     <script>
         console.log('🤖 Ruliadic Seed Auto-Generated Interface Loaded');
-        console.log('📊 Endpoints: """ + str(len(interface_data['endpoints'])) + """');
-        console.log('✨ Features: """ + str(len(interface_data['features'])) + """');
+        console.log('📊 Endpoints: {endpoints}');
+        console.log('✨ Features: {feature_count}');
         console.log('🚀 Independent Mode: Active');
     </script>
 </body>
 </html>
 """
 
-        return html_template
-
-    def generate_improved_chat_interface(self, specifications):
-        """Generate an improved chat interface"""
-        return {
-            'component': 'improved_chat_interface',
-            'version': '2.0.0',
+# Marketing information served by /api/marketing
+MARKETING_INFO = {
+    'title': 'Ruliadic Seed - Self-Generating AI System',
+    'tagline': 'The Complete Self-Generating AI That Creates Improved Versions of Itself',
+    'version': '2.0.0',
+    'capabilities': {
+        'self_generation': {
+            'title': 'Self-Generation Capabilities',
+            'description': 'Advanced AI system that generates complete, improved versions of itself',
             'features': [
-                'real_time_collaboration',
-                'voice_integration',
-                'advanced_syntax_highlighting',
-                'plugin_system',
-                'auto_complete',
-                'mobile_responsive'
-            ],
-            'code': '''
-class SelfImprovingChat {
-    constructor() {
-        this.features = [
-            'real_time_collaboration',
-            'voice_integration',
-            'advanced_syntax_highlighting',
-            'plugin_system'
-        ];
-        this.performanceMetrics = new Map();
-    }
-
+                'Self-Improving Chat Interface - Generates enhanced versions with real-time collaboration',
+                'Advanced API Server - Creates optimized servers with auto-scaling and monitoring',
+                'Self-Improvement Engine - Builds systems that continuously optimize themselves'
+            ]
+        },
+        'code_generation': {
+            'title': 'Advanced Code Generation',
+            'description': 'Generates actual, working code with production-ready features',
+            'example': '''class SelfImprovingChat {
     async improveResponseQuality() {
         // Analyze current responses
-        const analysis = await this.analyzeResponses();
         // Generate improved algorithms
-        const improvements = await this.generateImprovements(analysis);
         // Deploy updates automatically
-        return await this.deployImprovements(improvements);
-    }
-
-    async analyzeResponses() {
-        return {
-            averageResponseTime: '167ms',
-            userSatisfaction: 4.8,
-            improvementPotential: 'high'
-        };
+        return { quality: '+45%', speed: '-60%' };
     }
-}
-            ''',
-            'improvements': [
-                'Response quality: +65%',
-                'Processing speed: -75% latency',
-                'Memory efficiency: -45% usage',
-                'Feature completeness: +40%'
-            ]
-        }
-
-    def generate_advanced_api_server(self, specifications):
-        """Generate an advanced API server"""
-        return {
-            'component': 'advanced_api_server',
-            'version': '2.0.0',
-            'features': [
-                'auto_scaling',
-                'advanced_caching',
-                'real_time_monitoring',
-                'load_balancing',
-                'self_optimization',
-                'comprehensive_logging'
-            ],
-            'code': '''
-class AdvancedAPIServer:
-    def __init__(self):
-        self.self_improvement_engine = True
-        self.auto_optimization = True
-        self.performance_monitor = True
-        self.version = "2.0.0"
-
-    async def generate_improvements(self):
-        \"\"\"Generate and deploy system improvements\"\"\"
-
-        # Analyze current performance
-        analysis = await self.analyze_performance()
-
-        # Generate optimized code
-        improvements = await self.create_improvements(analysis)
-
-        # Auto-deploy improvements
-        await self.deploy_improvements(improvements)
-
-        return {
-            "improvements_generated": len(improvements),
-            "performance_impact": "+75%",
-            "deployment_status": "success"
-        }
-
-    async def analyze_performance(self):
-        return {
-            "response_time": "167ms",
-            "memory_usage": "45MB",
-            "cpu_utilization": "23%",
-            "optimization_potential": "high"
-        }
-            ''',
-            'improvements': [
-                'Auto-scaling capabilities',
-                'Redis caching integration',
-                'Grafana monitoring dashboards',
-                'Load balancing algorithms',
-                'Self-optimization engine'
-            ]
-        }
-
-    def generate_self_improvement_engine(self, specifications):
-        """Generate a self-improvement engine"""
-        return {
-            'component': 'self_improvement_engine',
-            'version': '3.0.0',
+}'''
+        },
+        'interface_features': {
+            'title': 'Enhanced Interface Features',
+            'description': 'One-click generation with intelligent contextual responses',
             'features': [
-                'continuous_learning',
-                'automatic_optimization',
-                'performance_prediction',
-                'adaptive_scaling',
-                'intelligent_caching',
-                'real_time_analytics'
-            ],
-            'code': '''
-class SelfImprovementEngine:
-    def __init__(self):
-        self.learning_rate = 0.001
-        self.optimization_targets = [
-            "response_quality",
-            "processing_speed",
-            "memory_efficiency",
-            "feature_completeness"
-        ]
-        self.improvement_history = []
-
-    async def continuous_improvement_loop(self):
-        \"\"\"Main self-improvement loop\"\"\"
-
-        while True:
-            # 1. Analyze current performance
-            current_metrics = await self.analyze_current_state()
-
-            # 2. Identify improvement opportunities
-            opportunities = await self.identify_opportunities(current_metrics)
-
-            # 3. Generate improvements
-            improvements = await self.generate_improvements(opportunities)
-
-            # 4. Test improvements
-            test_results = await self.test_improvements(improvements)
-
-            # 5. Deploy if successful
-            if test_results["success"]:
-                await self.deploy_improvements(improvements)
-                self.improvement_history.append({
-                    "timestamp": datetime.now(),
-                    "improvements": improvements,
-                    "impact": test_results["impact"]
-                })
-
-            # 6. Wait before next iteration
-            await asyncio.sleep(3600)  # Check every hour
-
-    async def analyze_current_state(self):
-        return {
-            "response_quality": 4.2,
-            "processing_speed": 167,
-            "memory_usage": 45.6,
-            "user_satisfaction": 4.1,
-            "system_health": "excellent"
-        }
-
-    async def identify_opportunities(self, metrics):
-        opportunities = []
-
-        if metrics["processing_speed"] > 150:
-            opportunities.append({
-                "type": "speed_optimization",
-                "potential_impact": "-40% latency",
-                "complexity": "medium"
-            })
-
-        if metrics["memory_usage"] > 40:
-            opportunities.append({
-                "type": "memory_optimization",
-                "potential_impact": "-25% usage",
-                "complexity": "low"
-            })
-
-        return opportunities
-            ''',
-            'improvements': [
-                'Continuous learning algorithms',
-                'Automatic performance optimization',
-                'Predictive scaling capabilities',
-                'Adaptive caching strategies',
-                'Real-time analytics and reporting',
-                'Intelligent resource allocation'
+                'Generate Improved Chat button - Creates enhanced chat interface',
+                'Generate Advanced API button - Builds optimized API server',
+                'Generate Self-Improvement Engine button - Creates auto-optimizing system',
+                'Smart Contextual Responses - Understands context and provides relevant answers'
             ]
         }
-
-    def extract_language(self, message):
-        """Extract programming language from message"""
-        languages = ['python', 'javascript', 'react', 'go', 'rust', 'java', 'c++', 'typescript']
-        message_lower = message.lower()
-
-        for lang in languages:
-            if lang in message_lower:
-                return lang.title()
-
-        return 'Python'  # Default
-
-    def extract_description(self, message):
-        """Extract description from generation request"""
-        # Simple extraction - can be enhanced
-        return message.replace('generate', '').replace('create', '').strip()
-
-    def run_empirical_improvement(self):
-        """Run the empirical improvement process"""
-        return {
-            'process': 'empirical_improvement',
-            'stages': [
-                'baseline_measurement',
-                'heuristic_refinement',
-                'meta_learning',
-                'final_benchmarking',
-                'report_generation'
-            ],
-            'results': {
-                'accuracy_improvement': '+27.5%',
-                'performance_improvement': '-43%',
-                'memory_optimization': '-11%',
-                'status': 'completed'
-            },
-            'timestamp': datetime.now().isoformat()
-        }
-
-    def get_benchmark_history(self):
-        """Get historical benchmark data"""
-        return [
-            {
-                'date': '2024-09-30',
-                'accuracy': 100.0,
-                'performance': 85,
-                'memory': 456
-            },
-            {
-                'date': '2024-09-29',
-                'accuracy': 98.5,
-                'performance': 92,
-                'memory': 478
-            },
-            {
-                'date': '2024-09-28',
-                'accuracy': 95.2,
-                'performance': 105,
-                'memory': 492
-            }
-        ]
+    },
+    'endpoints': [
+        '/api/chat - Intelligent contextual chat responses',
+        '/api/generate - Actual code generation for system components',
+        '/api/improve - System improvement processes',
+        '/api/benchmark - Performance measurement',
+        '/api/marketing - This marketing information'
+    ],
+    'access_points': {
+        'web_interface': 'http://localhost:8081/bootstrap.html',
+        'api_server': 'http://localhost:5000',
+        'health_check': 'http://localhost:5000/health'
+    },
+    'benefits': [
+        'Generate improved versions of itself automatically',
+        'Create complete applications from scratch',
+        'Optimize existing codebases intelligently',
+        'Deploy production-ready systems',
+        'Track performance improvements continuously',
+        'No API costs - uses free Grok model from xAI'
+    ],
+    'quick_start': [
+        'Open http://localhost:8081/bootstrap.html in your browser',
+        'Try the generation buttons for one-click component creation',
+        'Ask "Generate an improved version of this system"',
+        'Request "Create a better chat interface"',
+        'Command "Build a self-improving system"'
+    ],
+    'technical_specs': {
+        'model': 'Grok (xAI) - Free Tier',
+        'language': 'Python/JavaScript',
+        'architecture': 'Self-generating, self-improving',
+        'deployment': 'Local development servers',
+        'scalability': 'Auto-optimizing and self-scaling'
+    }
+}
 
 # HTML Template for API server
 HTML_TEMPLATE = '''
@@ -1535,6 +2434,7 @@ HTML_TEMPLATE = '''
         <div class="api-info">
             <h3>🔗 API Endpoints</h3>
             <div class="endpoint">POST /api/chat - Process chat messages</div>
+            <div class="endpoint">POST /api/chat/stream - Stream chat replies as server-sent events</div>
             <div class="endpoint">POST /api/improve - Run empirical improvement</div>
             <div class="endpoint">GET /api/benchmark - Get performance metrics</div>
             <div class="endpoint">GET /api/status - System status</div>
@@ -1552,7 +2452,7 @@ HTML_TEMPLATE = '''
             <h3>📋 Environment</h3>
             <div>Server Time: {{ api.system_status.uptime.strftime('%Y-%m-%d %H:%M:%S') }}</div>
             <div>Version: {{ api.system_status.version }}</div>
-            <div>Platform: Python {{ __import__('sys').version.split()[0] }}</div>
+            <div>Platform: Python {{ python_version }}</div>
         </div>
 
         <div style="text-align: center; margin-top: 2rem;">
@@ -1565,7 +2465,7 @@ HTML_TEMPLATE = '''
 
     <script>
         // Auto-refresh status
-        setInterval(async () => {
+        async function refreshStatus() {
             try {
                 const response = await fetch('/health');
                 const data = await response.json();
@@ -1573,30 +2473,99 @@ HTML_TEMPLATE = '''
             } catch (e) {
                 console.log('Status update failed:', e);
             }
-        }, 5000);
+        }
+        refreshStatus();
+        setInterval(refreshStatus, 5000);
     </script>
 </body>
 </html>
 '''
 
+def start_logging():
+    """Send log records through a queue so request threads never wait on output"""
+    records = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s'))
+    listener = logging.handlers.QueueListener(records, handler)
+
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(records)]
+    root.setLevel(logging.INFO)
+    listener.start()
+    atexit.register(listener.stop)
+
+def run_server(app, host='0.0.0.0', port=5000, on_worker_start=None):
+    """Serve the app with gunicorn's threaded worker instead of the dev server"""
+    on_worker_start = on_worker_start or (lambda: None)
+    if os.environ.get('CHATLOOP_DEV_SERVER') == '1':
+        # No debugger or reloader: the server binds every interface, and the
+        # reloader's parent process would warm a connection it never uses
+        on_worker_start()
+        app.run(host=host, port=port, debug=False, threaded=True)
+        return
+
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        # gunicorn is POSIX-only; fall back to the threaded Werkzeug server
+        on_worker_start()
+        app.run(host=host, port=port, debug=False, threaded=True)
+        return
+
+    class ChatLoopServer(BaseApplication):
+        def __init__(self, application, options):
+            self.application = application
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return self.application
+
+    # In-memory sessions are per process, so extra workers need the SQLite store
+    workers = int(os.environ.get('CHATLOOP_WORKERS', 1))
+    if workers > 1 and not SESSION_DB:
+        logger.warning('CHATLOOP_WORKERS=%d without CHATLOOP_SESSION_DB; using 1 worker', workers)
+        workers = 1
+
+    ChatLoopServer(app, {
+        'bind': f'{host}:{port}',
+        'workers': workers,
+        'worker_class': 'gthread',
+        'threads': int(os.environ.get('CHATLOOP_THREADS', 16)),
+        'keepalive': 30,  # Let ChatLoop clients reuse connections between calls
+        'worker_connections': 1000,
+        'timeout': 120,
+        # The listener thread does not survive fork, so the worker starts its own
+        'post_fork': lambda server, worker: start_logging(),
+        'post_worker_init': lambda worker: on_worker_start(),
+    }).run()
+
+def create_app():
+    """Application factory for running under an external WSGI server"""
+    start_logging()
+    api = ChatLoopAPI()
+    api.warm_upstream()
+    return api.app
+
 def main():
     """Main server function"""
+    start_logging()
     api = ChatLoopAPI()
 
-    print("🚀 Ruliad-Seed ChatLoop API Server")
-    print(f"📊 API Keys: OpenRouter={'✅' if api.api_keys['openrouter'] else '⚠️'}, Anthropic={'✅' if api.api_keys['anthropic'] else '⚠️'}")
-    print("🔗 Server starting at: http://localhost:5000")
-    print("🏥 Health check: http://localhost:5000/health")
-    print("💬 Chat API: http://localhost:5000/api/chat")
-    print("📈 Improvement API: http://localhost:5000/api/improve")
-    print("")
+    logger.info("🚀 Ruliad-Seed ChatLoop API Server")
+    logger.info("📊 API Keys: OpenRouter=%s, Anthropic=%s",
+                '✅' if api.api_keys['openrouter'] else '⚠️', '✅' if api.api_keys['anthropic'] else '⚠️')
+    logger.info("🔗 Server starting at: http://localhost:5000")
+    logger.info("🏥 Health check: http://localhost:5000/health")
+    logger.info("💬 Chat API: http://localhost:5000/api/chat")
+    logger.info("📈 Improvement API: http://localhost:5000/api/improve")
 
     # Start server
-    api.app.run(
-        host='0.0.0.0',
-        port=5000,
-        debug=False  # Set to False for production-like demo
-    )
+    run_server(api.app, host='0.0.0.0', port=5000, on_worker_start=api.warm_upstream)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file